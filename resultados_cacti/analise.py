@@ -1,214 +1,417 @@
 import os
-import re
-import csv
-import matplotlib.pyplot as plt
+import math
+import mmap
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+# Usar o motor DFA do RE2 (tempo linear) quando disponível; senão, o re padrão
+try:
+    import re2 as re
+except ImportError:
+    import re
+# Hyperscan (opcional) localiza todos os rótulos em uma única varredura SIMD
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+# Backend Agg e API orientada a objetos: sem a máquina de estados (e o registro
+# global de figuras) do pyplot
+import matplotlib
+import matplotlib.style
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 
 # Configurações
 RESULTS_DIR = "resultados_cacti"
 OUTPUT_CSV = "cacti_results_summary.csv"
 ERROR_LOG = "cacti_analysis_errors.log"
+CACHE_FILE = "cacti_results_cache.parquet"  # métricas já extraídas, por (mtime, tamanho)
+# Versão do formato do cache: incrementar ao alterar PATTERNS, os marcadores de erro,
+# FILENAME_PATTERN ou as chaves produzidas por parse_metrics
+CACHE_VERSION = 1
+# PNG em 150 dpi e compressão zlib mínima: a codificação domina o tempo de geração
+SAVEFIG_OPTIONS = {"dpi": 150, "pil_kwargs": {"compress_level": 1}}
+READ_BATCH_SIZE = 64  # máximo de arquivos por tarefa do pool de processos
+READ_ERROR_PREFIX = "Erro de leitura: "  # motivo exibido para falhas de leitura
+NUMERIC_COLS = ['access_time', 'cycle_time', 'read_energy', 'write_energy',
+                'leakage_power', 'area_mm2', 'efficiency']
+# Tipos das colunas numéricas extraídas, aplicados na construção do DataFrame
+# (float64: float32 alteraria os dígitos publicados no relatório CSV)
+METRIC_DTYPES = {col: 'float64' for col in [
+    'cache_size', 'block_size', 'associativity', 'access_time', 'cycle_time',
+    'read_energy', 'write_energy', 'leakage_power', 'sets', 'banks',
+    'height_mm', 'width_mm'
+]}
 
-# Padrões regex para extração de dados
+# Padrões regex para extração de dados (em bytes: aplicados direto ao arquivo mapeado)
 PATTERNS = {
-    "cache_size": r"Cache size\s*:\s*(\d+)",
-    "block_size": r"Block size\s*:\s*(\d+)",
-    "associativity": r"Associativity\s*:\s*(\d+|0)",
-    "access_time": r"Access time \(ns\):\s*([\d.]+)",
-    "cycle_time": r"Cycle time \(ns\):\s*([\d.]+)",
-    "read_energy": r"Read Energy \(nJ\):\s*([\d.]+)",
-    "write_energy": r"Write Energy \(nJ\):\s*([\d.]+)",
-    "leakage_power": r"Leakage Power Closed Page \(mW\):\s*([\d.]+)",
-    "area": r"Cache height x width \(mm\):\s*([\d.]+) x ([\d.]+)",
-    "sets": r"Number of sets\s*:\s*(\d+)",
-    "banks": r"Cache banks \(UCA\)\s*:\s*(\d+)"
+    "cache_size": rb"Cache size\s*:\s*(\d+)",
+    "block_size": rb"Block size\s*:\s*(\d+)",
+    "associativity": rb"Associativity\s*:\s*(\d+|0)",
+    "access_time": rb"Access time \(ns\):\s*([\d.]+)",
+    "cycle_time": rb"Cycle time \(ns\):\s*([\d.]+)",
+    "read_energy": rb"Read Energy \(nJ\):\s*([\d.]+)",
+    "write_energy": rb"Write Energy \(nJ\):\s*([\d.]+)",
+    "leakage_power": rb"Leakage Power Closed Page \(mW\):\s*([\d.]+)",
+    "area": rb"Cache height x width \(mm\):\s*([\d.]+) x ([\d.]+)",
+    "sets": rb"Number of sets\s*:\s*(\d+)",
+    "banks": rb"Cache banks \(UCA\)\s*:\s*(\d+)"
 }
 
-def extract_metrics(file_path):
-    """Extrai métricas de um arquivo de resultados do CACTI"""
-    # Tentar ler com diferentes codificações
-    content = None
-    encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            break
-        except UnicodeDecodeError:
+# Unir todos os padrões em uma única alternância com grupos nomeados,
+# para que o conteúdo do arquivo seja percorrido uma só vez
+# (flag MULTILINE embutido no padrão, pois o módulo re2 não exporta re.MULTILINE)
+METRICS_PATTERN = re.compile(
+    b"(?m)" + b"|".join(b"(?P<%s>%s)" % (key.encode(), pattern) for key, pattern in PATTERNS.items())
+)
+PATTERNS_GROUPS = {key: re.compile(pattern).groups for key, pattern in PATTERNS.items()}
+# Índice do grupo nomeado de cada chave na alternância (o re2 devolve lastgroup em
+# bytes para padrões em bytes, então a chave é obtida por lastindex)
+GROUP_KEYS = dict(zip(
+    accumulate((1 + PATTERNS_GROUPS[key] for key in PATTERNS), initial=1),
+    PATTERNS
+))
+# Marcadores dos arquivos de erro, procurados com find() antes de qualquer regex
+# (em UTF-8 e latin-1, pois os arquivos podem ter sido gerados em qualquer das duas)
+MARKER_ENCODINGS = ('utf-8', 'latin-1')
+INVALID_MARKERS = tuple("CONFIGURAÇÃO INVÁLIDA".encode(encoding) for encoding in MARKER_ENCODINGS)
+ERROR_MARKERS = tuple("ERRO NA EXECUÇÃO".encode(encoding) for encoding in MARKER_ENCODINGS) + (b"ERROR",)
+# Nome dos arquivos de resultado: resultado_<tamanho>_<bloco>_<associatividade>.out
+FILENAME_PATTERN = re.compile(r"[^_]+_(?P<cache_size>\d+)_(?P<block_size>\d+)_(?P<associativity>\d+)\.out$")
+
+# Banco Hyperscan com todos os padrões; os valores são recortados depois com o
+# padrão individual ancorado na posição encontrada
+HS_DATABASE = None
+if hyperscan is not None:
+    HS_KEYS = list(PATTERNS)
+    HS_KEY_PATTERNS = {key: re.compile(pattern) for key, pattern in PATTERNS.items()}
+    HS_DATABASE = hyperscan.Database()
+    HS_DATABASE.compile(
+        expressions=list(PATTERNS.values()),
+        ids=list(range(len(HS_KEYS))),
+        elements=len(HS_KEYS),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(HS_KEYS)
+    )
+
+def scan_metrics(content):
+    """Retorna {chave: grupos de valor} com a primeira ocorrência de cada padrão"""
+    found = {}
+    if HS_DATABASE is not None:
+        starts = {}
+
+        def on_match(pattern_id, start, end, flags, context):
+            if start < starts.get(pattern_id, len(content)):
+                starts[pattern_id] = start
+
+        HS_DATABASE.scan(content, match_event_handler=on_match)
+        for pattern_id, start in starts.items():
+            key = HS_KEYS[pattern_id]
+            match = HS_KEY_PATTERNS[key].match(content, start)
+            if match:
+                found[key] = tuple(group.decode('utf-8') for group in match.groups())
+        return found
+
+    for match in METRICS_PATTERN.finditer(content):
+        key = GROUP_KEYS[match.lastindex]
+        if key in found:
             continue
-    
+        # Os grupos de valor vêm logo após o grupo nomeado da chave
+        groups = match.groups()[match.lastindex:match.lastindex + PATTERNS_GROUPS[key]]
+        found[key] = tuple(group.decode('utf-8') for group in groups)
+    return found
+
+def read_result_file(file_path):
+    """Mapeia em memória (somente leitura) um arquivo de resultados do CACTI"""
+    # Sem cópia para um str do Python: o kernel carrega as páginas sob demanda e os
+    # padrões em bytes rodam direto sobre o mapeamento
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""  # arquivos vazios não podem ser mapeados
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # Antecipar a leitura das páginas enquanto outros arquivos do lote são processados
+    if hasattr(mmap, "MADV_WILLNEED"):
+        content.madvise(mmap.MADV_WILLNEED)
+    return content
+
+def extract_metrics(file_path, content=None):
+    """Extrai métricas de um arquivo de resultados do CACTI"""
     if content is None:
-        # Se todas as codificações falharem, tentar com ignorar erros
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            content = read_result_file(file_path)
         except Exception as e:
-            return {"status": "error", "reason": f"Erro de leitura: {str(e)}"}
+            return {"status": "error", "reason": f"{READ_ERROR_PREFIX}{str(e)}", "read_error": True}
     
+    try:
+        return parse_metrics(file_path, content)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+def parse_metrics(file_path, content):
+    """Extrai métricas do conteúdo (em bytes) de um arquivo de resultados do CACTI"""
     # Verificar se é uma configuração inválida
-    if "CONFIGURAÇÃO INVÁLIDA" in content:
-        return {"status": "invalid", "reason": content.split("Motivo:")[1].strip() if "Motivo:" in content else "Invalid configuration"}
+    if any(content.find(marker) != -1 for marker in INVALID_MARKERS):
+        motivo = content.find(b"Motivo:")
+        if motivo == -1:
+            return {"status": "invalid", "reason": "Invalid configuration"}
+        reason = content[motivo + len(b"Motivo:"):].split(b"Motivo:")[0]
+        try:
+            reason = reason.decode('utf-8')
+        except UnicodeDecodeError:
+            reason = reason.decode('latin-1')
+        return {"status": "invalid", "reason": reason.strip()}
     
-    if "ERRO NA EXECUÇÃO" in content or "ERROR" in content:
+    if any(content.find(marker) != -1 for marker in ERROR_MARKERS):
         return {"status": "error", "reason": "Runtime error"}
     
     # Extrair parâmetros do nome do arquivo
-    filename = os.path.basename(file_path)
-    parts = filename.split('_')
-    metrics = {
-        "cache_size": parts[1] if len(parts) > 1 else "2048",
-        "block_size": parts[2] if len(parts) > 2 else "?",
-        "associativity": parts[3].split('.')[0] if len(parts) > 3 else "?",
-        "status": "valid"
-    }
-    
-    # Extrair métricas usando regex
-    for key, pattern in PATTERNS.items():
-        match = re.search(pattern, content)
-        if match:
-            if key == "area":
-                try:
-                    metrics["height_mm"] = float(match.group(1))
-                    metrics["width_mm"] = float(match.group(2))
-                    metrics["area_mm2"] = metrics["height_mm"] * metrics["width_mm"]
-                except ValueError:
-                    pass
-            else:
-                try:
-                    metrics[key] = float(match.group(1)) if match.group(1).replace('.', '', 1).isdigit() else match.group(1)
-                except:
-                    metrics[key] = match.group(1)
-    
-    # Calcular métricas derivadas
-    if "access_time" in metrics and "cycle_time" in metrics:
-        try:
-            metrics["efficiency"] = float(metrics["access_time"]) / float(metrics["cycle_time"])
-        except:
-            pass
+    match = FILENAME_PATTERN.match(os.path.basename(file_path))
+    if match:
+        metrics = match.groupdict()
+    else:
+        metrics = {"cache_size": "2048", "block_size": "?", "associativity": "?"}
+    metrics["status"] = "valid"
+    
+    # Extrair métricas usando regex (varredura única; vale a primeira ocorrência de cada chave)
+    for key, groups in scan_metrics(content).items():
+        value = groups[0]
+        if key == "area":
+            try:
+                metrics["height_mm"] = float(value)
+                metrics["width_mm"] = float(groups[1])
+            except ValueError:
+                pass
+        else:
+            try:
+                metrics[key] = float(value)
+            except ValueError:
+                metrics[key] = value
     
     return metrics
 
+def extract_metrics_batch(filenames):
+    """Mapeia um lote de arquivos de RESULTS_DIR e extrai as métricas de cada um"""
+    file_paths = [os.path.join(RESULTS_DIR, filename) for filename in filenames]
+    # Mapear o lote inteiro antes de processar: o madvise(WILLNEED) de cada arquivo
+    # dispara a leitura antecipada no kernel, que segue enquanto os anteriores são lidos
+    contents = []
+    for file_path in file_paths:
+        try:
+            contents.append(read_result_file(file_path))
+        except Exception as e:
+            contents.append(e)
+    
+    batch_metrics = []
+    for filename, file_path, content in zip(filenames, file_paths, contents):
+        if isinstance(content, Exception):
+            metrics = {"status": "error", "reason": f"{READ_ERROR_PREFIX}{str(content)}", "read_error": True}
+        else:
+            metrics = extract_metrics(file_path, content)
+        metrics["filename"] = filename
+        batch_metrics.append(metrics)
+    return batch_metrics
+
+def iter_result_files():
+    """Percorre RESULTS_DIR sob demanda, devolvendo as entradas dos arquivos .out"""
+    with os.scandir(RESULTS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".out") and entry.is_file():
+                yield entry
+
+def load_cache():
+    """Carrega o cache de execuções anteriores: {nome do arquivo: ((mtime, tamanho), métricas)}"""
+    try:
+        cache_df = pd.read_parquet(CACHE_FILE)
+    except Exception:
+        # Cache ausente, ilegível ou sem pyarrow: extrair tudo novamente
+        return {}
+    # Cache de outra versão (ou sem as colunas de controle): descartar
+    if not {"cache_version", "filename", "mtime_ns", "size"} <= set(cache_df.columns):
+        return {}
+    if (cache_df["cache_version"] != CACHE_VERSION).any():
+        return {}
+    cache = {}
+    for row in cache_df.to_dict("records"):
+        file_stat = (row.pop("mtime_ns"), row.pop("size"))
+        del row["cache_version"]
+        # Colunas ausentes no arquivo original voltam como nulas; descartá-las
+        cache[row["filename"]] = (file_stat, {key: value for key, value in row.items() if not pd.isna(value)})
+    return cache
+
+def save_cache(all_metrics, file_stats):
+    """Grava as métricas extraídas junto com o mtime e o tamanho de cada arquivo"""
+    # Falhas de leitura são transitórias (ex.: permissão) e não mudam o mtime;
+    # guardá-las faria o arquivo aparecer como erro em todas as execuções seguintes
+    records = [
+        dict(metrics, mtime_ns=file_stats[metrics["filename"]][0], size=file_stats[metrics["filename"]][1],
+             cache_version=CACHE_VERSION)
+        for metrics in all_metrics
+        if not metrics.get("read_error")
+    ]
+    cache_df = pd.DataFrame.from_records(records)
+    # Colunas com tipos mistos (número extraído ou texto do nome do arquivo) são gravadas como texto
+    for col in cache_df.columns[cache_df.dtypes == object]:
+        cache_df[col] = cache_df[col].map(lambda value: value if pd.isna(value) else str(value))
+    try:
+        cache_df.to_parquet(CACHE_FILE, engine='pyarrow', compression='zstd', index=False)
+    except (ImportError, OSError) as e:
+        print(f"Cache de resultados não salvo: {str(e)}")
+
 def analyze_results():
     """Analisa todos os resultados e gera relatórios"""
-    all_metrics = []
     error_count = 0
     valid_count = 0
     
     print(f"Analisando resultados em {RESULTS_DIR}...")
     
-    # Processar todos os arquivos de resultados
-    for filename in os.listdir(RESULTS_DIR):
-        if filename.endswith(".out"):
-            file_path = os.path.join(RESULTS_DIR, filename)
-            metrics = extract_metrics(file_path)
-            metrics["filename"] = filename
-            all_metrics.append(metrics)
-            
-            if metrics["status"] in ["error", "invalid"]:
-                error_count += 1
-            else:
-                valid_count += 1
-    
-    # Salvar relatório CSV
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = [
-            "filename", "status", "cache_size", "block_size", "associativity",
-            "access_time", "cycle_time", "read_energy", "write_energy",
-            "leakage_power", "area_mm2", "efficiency", "sets", "banks"
-        ]
-        
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for metrics in all_metrics:
-            # Preencher valores ausentes para configurações inválidas
-            row = {field: metrics.get(field, "N/A") for field in fieldnames}
-            writer.writerow(row)
+    # Reaproveitar as métricas de arquivos que não mudaram desde a última execução
+    cache = load_cache()
+    file_stats = {}
+    all_metrics = []
+    
+    pending = []  # (posição no relatório, nome) dos arquivos a extrair
+    for entry in iter_result_files():
+        stat = entry.stat()
+        file_stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        cached_stat, cached_metrics = cache.get(entry.name, (None, None))
+        if cached_stat == file_stats[entry.name]:
+            all_metrics.append(cached_metrics)
+        else:
+            # Reservar a posição para que o relatório siga a ordem da varredura
+            pending.append((len(all_metrics), entry.name))
+            all_metrics.append(None)
+    
+    # Processar os arquivos restantes em paralelo (um processo por núcleo), dividindo-os
+    # em lotes de até READ_BATCH_SIZE para que todos os processos recebam trabalho
+    pending_names = [filename for _, filename in pending]
+    batch_size = min(READ_BATCH_SIZE, max(1, math.ceil(len(pending_names) / (os.cpu_count() or 1))))
+    batches = [pending_names[i:i + batch_size] for i in range(0, len(pending_names), batch_size)]
+    fresh_metrics = []
+    with ProcessPoolExecutor() as executor:
+        for batch_metrics in executor.map(extract_metrics_batch, batches):
+            fresh_metrics.extend(batch_metrics)
+    for (index, _), metrics in zip(pending, fresh_metrics):
+        all_metrics[index] = metrics
+    # Regravar o cache só se algo foi extraído ou algum arquivo deixou de existir
+    if pending or not cache.keys() <= file_stats.keys():
+        save_cache(all_metrics, file_stats)
+    
+    for metrics in all_metrics:
+        if metrics["status"] in ["error", "invalid"]:
+            error_count += 1
+        else:
+            valid_count += 1
+    
+    # Salvar relatório CSV (escrita feita pelo writer em C do pandas)
+    fieldnames = [
+        "filename", "status", "cache_size", "block_size", "associativity",
+        "access_time", "cycle_time", "read_energy", "write_energy",
+        "leakage_power", "area_mm2", "efficiency", "sets", "banks"
+    ]
+    df = pd.DataFrame.from_records(all_metrics, columns=fieldnames + ["height_mm", "width_mm"])
+    # Tipar as colunas numéricas uma única vez (valores não numéricos viram NaN)
+    metric_cols = list(METRIC_DTYPES)
+    df[metric_cols] = df[metric_cols].apply(pd.to_numeric, errors='coerce').astype(METRIC_DTYPES)
+    
+    # Calcular métricas derivadas sobre as colunas inteiras (NaN quando indefinidas)
+    df["efficiency"] = df["access_time"] / df["cycle_time"].where(df["cycle_time"] != 0)
+    df["area_mm2"] = df["height_mm"] * df["width_mm"]
+    # Preencher valores ausentes para configurações inválidas
+    df.to_csv(OUTPUT_CSV, columns=fieldnames, index=False, na_rep="N/A", encoding='utf-8', lineterminator="\r\n")
     
     print(f"\nResultados analisados: {len(all_metrics)}")
     print(f"  Configurações válidas: {valid_count}")
     print(f"  Configurações inválidas/erros: {error_count}")
     print(f"Relatório CSV salvo em: {OUTPUT_CSV}")
     
-    return all_metrics
+    return df
 
-def visualize_results(df):
-    """Cria visualizações dos resultados válidos"""
-    valid_df = df[df["status"] == "valid"]
+def valid_results(df):
+    """Seleciona as configurações válidas (colunas numéricas já tipadas por analyze_results)"""
+    return df[df["status"] == "valid"].copy()
+
+def plot_access_time(valid_df):
+    """Gráfico 1: Tempo de acesso por configuração (uma coluna por tamanho de bloco)"""
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    access_pivot = valid_df.pivot_table(index="associativity", columns="block_size", values="access_time")
+    access_pivot.rename(columns=lambda block_size: f"Block: {block_size}B").plot(ax=ax, style='o-')
+    
+    ax.set_title("Tempo de Acesso por Configuração")
+    ax.set_xlabel("Associatividade")
+    ax.set_ylabel("Tempo de Acesso (ns)")
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+def plot_read_energy(valid_df):
+    """Gráfico 2: Consumo energético (uma coluna por associatividade)"""
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    energy_pivot = valid_df.pivot_table(index="block_size", columns="associativity", values="read_energy")
+    energy_pivot.rename(columns=lambda associativity: f"Assoc: {associativity}").plot(ax=ax, style='s--')
     
+    ax.set_title("Energia de Leitura por Configuração")
+    ax.set_xlabel("Tamanho do Bloco (bytes)")
+    ax.set_ylabel("Energia de Leitura (nJ)")
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+def plot_area_vs_access(valid_df):
+    """Gráfico 3: Área ocupada"""
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    scatter = ax.scatter(
+        valid_df["access_time"],
+        valid_df["area_mm2"],
+        c=valid_df["block_size"],
+        s=valid_df["associativity"] * 20,
+        cmap="viridis",
+        alpha=0.7
+    )
+    
+    fig.colorbar(scatter, ax=ax, label="Tamanho do Bloco (bytes)")
+    ax.set_title("Relação entre Tempo de Acesso e Área Ocupada")
+    ax.set_xlabel("Tempo de Acesso (ns)")
+    ax.set_ylabel("Área (mm²)")
+    ax.grid(True)
+    return fig
+
+# Gráficos gerados e arquivo de saída de cada um
+PLOTS = [
+    (plot_access_time, "access_time_comparison.png"),
+    (plot_read_energy, "read_energy_comparison.png"),
+    (plot_area_vs_access, "area_vs_access.png"),
+]
+
+def visualize_results(valid_df):
+    """Cria visualizações dos resultados válidos (já convertidos por valid_results)"""
     if valid_df.empty:
         print("Nenhum dado válido para visualização.")
         return
     
     # Configurar estilo dos gráficos
-    plt.style.use('seaborn-v0_8-darkgrid')
-    plt.rcParams.update({'font.size': 10})
+    matplotlib.style.use('seaborn-v0_8-darkgrid')
+    matplotlib.rcParams.update({'font.size': 10})
     
     print("\nCriando visualizações...")
     
-    # Converter colunas para float
-    for col in ['access_time', 'cycle_time', 'read_energy', 'write_energy', 'leakage_power', 'area_mm2', 'efficiency']:
-        valid_df[col] = pd.to_numeric(valid_df[col], errors='coerce')
-    
     # Remover linhas com valores NaN
     valid_df = valid_df.dropna(subset=['access_time', 'read_energy', 'area_mm2'])
     
-    # Gráfico 1: Tempo de acesso por configuração
-    plt.figure(figsize=(12, 8))
-    for block_size in valid_df["block_size"].unique():
-        subset = valid_df[valid_df["block_size"] == block_size]
-        plt.plot(
-            subset["associativity"], 
-            subset["access_time"],
-            'o-', 
-            label=f"Block: {block_size}B"
-        )
-    
-    plt.title("Tempo de Acesso por Configuração")
-    plt.xlabel("Associatividade")
-    plt.ylabel("Tempo de Acesso (ns)")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig("access_time_comparison.png", dpi=300)
-    plt.close()
-    
-    # Gráfico 2: Consumo energético
-    plt.figure(figsize=(12, 8))
-    for associativity in valid_df["associativity"].unique():
-        subset = valid_df[valid_df["associativity"] == associativity]
-        plt.plot(
-            subset["block_size"], 
-            subset["read_energy"],
-            's--', 
-            label=f"Assoc: {associativity}"
-        )
-    
-    plt.title("Energia de Leitura por Configuração")
-    plt.xlabel("Tamanho do Bloco (bytes)")
-    plt.ylabel("Energia de Leitura (nJ)")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig("read_energy_comparison.png", dpi=300)
-    plt.close()
-    
-    # Gráfico 3: Área ocupada
-    plt.figure(figsize=(12, 8))
-    scatter = plt.scatter(
-        valid_df["access_time"],
-        valid_df["area_mm2"],
-        c=pd.to_numeric(valid_df["block_size"], errors='coerce'),
-        s=pd.to_numeric(valid_df["associativity"], errors='coerce') * 20,
-        cmap="viridis",
-        alpha=0.7
-    )
-    
-    plt.colorbar(scatter, label="Tamanho do Bloco (bytes)")
-    plt.title("Relação entre Tempo de Acesso e Área Ocupada")
-    plt.xlabel("Tempo de Acesso (ns)")
-    plt.ylabel("Área (mm²)")
-    plt.grid(True)
-    plt.savefig("area_vs_access.png", dpi=300)
-    plt.close()
+    # Cada gráfico é salvo em segundo plano enquanto o próximo é montado. A rasterização
+    # Agg mantém o GIL; só a compressão zlib feita pelo Pillow o libera, então a
+    # sobreposição se limita a essa etapa. As figuras são objetos Figure independentes
+    # (fora do pyplot, que não é thread-safe), por isso podem ser salvas de outra thread
+    with ThreadPoolExecutor(max_workers=len(PLOTS)) as executor:
+        saves = [executor.submit(plot(valid_df).savefig, path, **SAVEFIG_OPTIONS) for plot, path in PLOTS]
+        for save in saves:
+            save.result()
     
     print("Visualizações salvas como PNG")
 
@@ -219,26 +422,17 @@ def main():
         print(f"Diretório {RESULTS_DIR} criado. Por favor, coloque os arquivos de resultados nele.")
         return
     
-    # Analisar resultados
-    results = analyze_results()
+    # Analisar resultados (o DataFrame é usado direto, sem reler o CSV salvo)
+    df = analyze_results()
     
-    # Carregar dados para visualização
     try:
-        df = pd.read_csv(OUTPUT_CSV, encoding='utf-8')
-        visualize_results(df)
+        valid_df = valid_results(df)
+        visualize_results(valid_df)
         
         # Mostrar resumo estatístico
         print("\nResumo estatístico para configurações válidas:")
-        valid_df = df[df["status"] == "valid"]
-        
-        # Converter colunas numéricas
-        numeric_cols = ['access_time', 'cycle_time', 'read_energy', 'write_energy', 
-                       'leakage_power', 'area_mm2', 'efficiency']
-        for col in numeric_cols:
-            valid_df[col] = pd.to_numeric(valid_df[col], errors='coerce')
-        
         if not valid_df.empty:
-            print(valid_df[numeric_cols].describe())
+            print(valid_df[NUMERIC_COLS].describe())
         
     except Exception as e:
         print(f"Erro ao gerar visualizações: {str(e)}")